@@ -53,11 +53,12 @@ def rmtree(path: str, confirm: bool):
 
 @data.command()
 @click.option("-o", "--output", default="anime-genre.csv")
-def load(output: str):
-    """Unpacks archive, joins the tables and writes CSV file."""
+@click.option("--extract", is_flag=True, help="Extract the CSV files to the raw data directory")
+def load(output: str, extract: bool):
+    """Reads archive, joins the tables and writes CSV file."""
 
     archive_path = Filepath.archive_path
-    ds_loader = DatasetLoader(log=log, archive_path=archive_path)
+    ds_loader = DatasetLoader(log=log, archive_path=archive_path, extract=extract)
     anime_pd, ratings_pd = ds_loader.load_pandas_data_frames()
     ds_processor = DatasetProcessor(log=log, anime_pd=anime_pd, ratings_pd=ratings_pd)
     ds_processor.save_to_csv(filename=output)
@@ -6,11 +6,10 @@ from anime_recommender.scripts.setup import DatasetLoader, DatasetContext, Datas
 
 def context_factory(log: logging.Logger, ratio: float, seed: int) -> DatasetContext:
     archive_path = Filepath.archive_path
-    dataraw_path = Filepath.data_raw
-    assert dataraw_path.exists(), f"{str(dataraw_path)} doesn't exist"
 
+    # Reuse the extracted CSVs if all present; otherwise stream them from the archive
     loader = DatasetLoader(log=log, archive_path=archive_path)
-    loader._extracted = True
+    loader.extract = loader.extracted
     anime_pd, ratings_pd = loader.load_pandas_data_frames()
 
     processor = DatasetProcessor(log=log, anime_pd=anime_pd, ratings_pd=ratings_pd)
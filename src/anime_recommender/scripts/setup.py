@@ -1,5 +1,5 @@
-import shutil
 import logging
+import zipfile
 
 from pathlib import Path
 
@@ -18,40 +18,53 @@ class DatasetLoader:
     | Class used to load and unpack the DataFrames needed |
     +---------------------------------------------------"""
 
-    def __init__(self, log: logging.Logger, archive_path: Path) -> None:
+    # Only the columns used downstream are parsed, with explicit dtypes.
+    # Assumes IDs stay below 2**31 and ratings are 1-10 with no missing values;
+    # a NaN rating makes read_csv fail on the int8 cast.
+    _schema = {
+        "anime.csv": {"MAL_ID": np.int32, "Name": str, "Genres": str},
+        "rating_complete.csv": {"user_id": np.int32, "anime_id": np.int32, "rating": np.int8},
+    }
+
+    def __init__(self, log: logging.Logger, archive_path: Path, extract: bool = False) -> None:
         self.log = log
         self.archive_path = archive_path
         self.data_raw = Filepath.data_raw
-        self._extracted = False
+        self.extract = extract
+
+    @property
+    def extracted(self) -> bool:
+        """Whether all the neccessary CSVs already exist under the raw data directory."""
+
+        return all(self.data_raw.joinpath(csv).exists() for csv in self._schema)
 
     def _unpack_archive(self) -> None:
-        """Unpacks the ZipFile and keeps only neccessary files."""
-
-        if not self._extracted:
-            self.log.info("===== Unpack Archive Job =====")
-            shutil.unpack_archive(
-                filename=self.archive_path,
-                extract_dir=self.data_raw,
-                format="zip",
-            )
-            for file_ in self.data_raw.iterdir():
-                if file_.name == "html folder":
-                    self.log.debug(f"Removing tree {file_.name}")
-                    shutil.rmtree(file_, ignore_errors=True)
-                elif file_.name not in ("anime.csv", "rating_complete.csv"):
-                    self.log.debug(f"Unlinking file {file_.name}")
-                    Path.unlink(file_)
-            self._extracted = True
+        """Extracts only the neccessary members of the ZipFile."""
+
+        self.log.info("===== Unpack Archive Job =====")
+        with zipfile.ZipFile(self.archive_path) as archive:
+            for member in self._schema:
+                self.log.debug(f"Extracting member {member}")
+                archive.extract(member, path=self.data_raw)
+
+    def _read_csv(self, csv: str) -> pd.DataFrame:
+        """Parses a CSV; either from the extracted file or streamed from the ZipFile member."""
+
+        dtype = self._schema[csv]
+        if self.extract:
+            return pd.read_csv(self.data_raw.joinpath(csv), usecols=list(dtype), dtype=dtype)
+
+        with zipfile.ZipFile(self.archive_path) as archive, archive.open(csv) as member:
+            return pd.read_csv(member, usecols=list(dtype), dtype=dtype)
 
     def load_pandas_data_frames(self) -> list[pd.DataFrame]:
         """Returns the neccessary DataFrames"""
 
-        if not self._extracted:
+        if self.extract and not self.extracted:
             self._unpack_archive()
 
-        # NOTE: on the cloud the ordering shifts --can't use .iterdir() method
-        # return [pd.read_csv(self.data_raw.joinpath(csv.name)) for csv in self.data_raw.iterdir()]
-        return [pd.read_csv(self.data_raw.joinpath(csv)) for csv in ("anime.csv", "rating_complete.csv")]
+        self.log.info("===== Read CSV Job =====")
+        return [self._read_csv(csv) for csv in ("anime.csv", "rating_complete.csv")]
 
 
 class DatasetProcessor: